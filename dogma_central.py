@@ -1,14 +1,29 @@
+import os
+
 from graphviz import Digraph
 
-fluxo = Digraph('dogma', format='png')
 
-fluxo.attr(rankdir='LR', bgcolor='lightgrey', fontname='Helvetica')
+def build():
+    fluxo = Digraph('dogma', format='png')
+
+    fluxo.attr(rankdir='LR', bgcolor='lightgrey', fontname='Helvetica')
+
+    fluxo.node('DNA', shape='box', style='filled', color='lightblue', fontname='Helvetica-Bold')
+    fluxo.node('RNA', shape='ellipse', style='filled', color='lightgreen', fontname='Helvetica-Bold')
+    fluxo.node('Proteína', shape='diamond', style='filled', color='lightpink', fontname='Helvetica-Bold')
+
+    fluxo.edge('DNA', 'RNA', label='Transcrição')
+    fluxo.edge('RNA', 'Proteína', label='Tradução')
+
+    return fluxo
+
 
-fluxo.node('DNA', shape='box', style='filled', color='lightblue', fontname='Helvetica-Bold')
-fluxo.node('RNA', shape='ellipse', style='filled', color='lightgreen', fontname='Helvetica-Bold')
-fluxo.node('Proteína', shape='diamond', style='filled', color='lightpink', fontname='Helvetica-Bold')
+def is_up_to_date(image='dogma_central.png'):
+    # A imagem só precisa ser gerada de novo se este script for mais recente
+    return (os.path.exists(image)
+            and os.path.getmtime(image) >= os.path.getmtime(__file__))
 
-fluxo.edge('DNA', 'RNA', label='Transcrição')
-fluxo.edge('RNA', 'Proteína', label='Tradução')
 
-fluxo.render('dogma_central', format='png')
+if __name__ == '__main__':
+    if not is_up_to_date():
+        build().render('dogma_central', format='png')
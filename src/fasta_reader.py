@@ -3,6 +3,18 @@ Módulo responsável pela leitura de arquivos FASTA.
 Implementa Strategy Pattern para diferentes formatos.
 """
 
+from typing import Optional
+
+# Tabela de limpeza: converte para maiúscula em uma única passada (bytes.translate)
+_SEQ_UPPER = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Caracteres removidos da sequência na mesma passada (incluindo tabulações)
+_SEQ_DELETE = b' \t\r\n\x0b\x0c'
+
+# Código do \r, para busca rápida (inteiro em bytes usa memchr)
+_CR = ord('\r')
+
+
 class FastaReader:
     """
     Leitor de arquivos FASTA.
@@ -22,24 +34,34 @@ class FastaReader:
             Dicionário com 'header' e 'sequence'
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-
-            # Interpretação do formato FASTA
             header = ""
-            sequence_lines = []
+            sequence_buffer = bytearray()
 
-            for line in lines:
-                line = line.strip()
+            # Interpretação do formato FASTA, linha a linha e em bytes
+            # (apenas o cabeçalho e a sequência final são decodificados)
+            with open(filepath, 'rb') as file:
+                for line in file:
+                    line = line.strip()
 
-                if line.startswith('>'):
-                    # Linha de cabeçalho
-                    header = line[1:]  # Remove o '>'
-                elif line:
-                    # Linha de sequência (remove espaços e converte para maiúscula)
-                    sequence_lines.append(line.upper().replace(' ', ''))
+                    if _CR in line:
+                        # \r isolado (Mac clássico): o modo binário só separa
+                        # linhas no \n, então as linhas são separadas aqui
+                        for part in line.split(b'\r'):
+                            part = part.strip()
 
-            sequence = ''.join(sequence_lines)
+                            if part.startswith(b'>'):
+                                header = part[1:].decode('utf-8')
+                            elif part:
+                                sequence_buffer += part
+                    elif line.startswith(b'>'):
+                        # Linha de cabeçalho
+                        header = line[1:].decode('utf-8')  # Remove o '>'
+                    elif line:
+                        # Linha de sequência (limpeza feita uma única vez no final)
+                        sequence_buffer += line
+
+            # Converte para maiúscula e remove espaços em uma única passada
+            sequence = sequence_buffer.translate(_SEQ_UPPER, _SEQ_DELETE).decode('utf-8')
 
             return {
                 'header': header,
@@ -49,3 +71,34 @@ class FastaReader:
         except Exception as e:
             print(f"Erro ao ler arquivo: {e}")
             return None
+
+    def read_header(self, filepath: str) -> Optional[str]:
+        """
+        Lê apenas o cabeçalho de um arquivo FASTA.
+
+        Para na primeira linha de cabeçalho, sem ler nem montar a
+        sequência (útil quando só o identificador é necessário).
+        Como este leitor trata um registro por arquivo, retorna o
+        primeiro cabeçalho; read() mantém o último se houver vários.
+
+        Args:
+            filepath: Caminho para o arquivo FASTA
+
+        Returns:
+            Cabeçalho sem o '>' (string vazia se não houver cabeçalho),
+            ou None se o arquivo não puder ser lido
+        """
+        try:
+            # Modo texto: reconhece \n, \r\n e \r, e só lê até o cabeçalho
+            with open(filepath, 'r', encoding='utf-8') as file:
+                for line in file:
+                    line = line.strip()
+
+                    if line.startswith('>'):
+                        return line[1:]  # Remove o '>'
+
+            return ""
+
+        except Exception as e:
+            print(f"Erro ao ler arquivo: {e}")
+            return None
@@ -13,6 +13,9 @@ class SequenceAnalyzer:
     sem conhecer detalhes de I/O ou formato de dados.
     """
 
+    # Nucleotídeos possíveis (constante imutável, criada uma única vez)
+    NUCLEOTIDES = ('A', 'C', 'G', 'T', 'U')
+
     def analyze(self, sequence: str) -> dict:
         """
         Calcula estatísticas da sequência.
@@ -51,13 +54,9 @@ class SequenceAnalyzer:
         Returns:
             Dicionário com contagens
         """
-        # Nucleotídeos possíveis
-        nucleotides = ['A', 'C', 'G', 'T', 'U']
-
-        counts = {nt: sequence.count(nt) for nt in nucleotides}
-
-        # Remove contagens zero
-        return {k: v for k, v in counts.items() if v > 0}
+        # Conta cada nucleotídeo uma única vez, já descartando contagens zero
+        return {nt: count for nt in self.NUCLEOTIDES
+                if (count := sequence.count(nt)) > 0}
 
     def _calculate_gc_percent(self, counts: dict, length: int) -> float:
         """
@@ -12,6 +12,9 @@ class Transcription:
     seguindo as regras biológicas (T -> U).
     """
 
+    # Tabela de transcrição (T -> U), criada uma única vez
+    _DNA_TO_RNA = str.maketrans('T', 'U')
+
     def transcribe(self, dna_sequence: str) -> str:
         """
         Transcreve DNA para RNA.
@@ -29,6 +32,6 @@ class Transcription:
             return ""
 
         # Transcrição: T -> U
-        rna_sequence = dna_sequence.replace('T', 'U')
+        rna_sequence = dna_sequence.translate(self._DNA_TO_RNA)
 
         return rna_sequence
@@ -47,17 +47,19 @@ class Translation:
 
         protein = []
 
+        # Referências locais evitam buscas de atributo a cada códon
+        get_amino_acid = self.CODON_TABLE.get
+        append = protein.append
+
         # Processa a sequência em códons (grupos de 3 nucleotídeos)
         for i in range(0, len(rna_sequence) - 2, 3):
-            codon = rna_sequence[i:i+3]
-
-            # Traduz o códon
-            amino_acid = self.CODON_TABLE.get(codon, 'X')  # 'X' para códons desconhecidos
+            # Traduz o códon ('X' para códons desconhecidos)
+            amino_acid = get_amino_acid(rna_sequence[i:i+3], 'X')
 
             # Para no códon de parada
             if amino_acid == '*':
                 break
 
-            protein.append(amino_acid)
+            append(amino_acid)
 
         return ''.join(protein)
@@ -54,6 +54,38 @@ ATG C GAT C"""
 
         assert result['sequence'] == 'ATGCGATC'
 
+    def test_read_with_tabs(self, tmp_path):
+        """Testa que tabulações e outros espaços dentro da linha são removidos."""
+        fasta_file = tmp_path / "tabs.fasta"
+        fasta_file.write_bytes(b'>with_tabs\nA\tC\x0bG\x0cT\n')
+
+        reader = FastaReader()
+        result = reader.read(str(fasta_file))
+
+        assert result['sequence'] == 'ACGT'
+
+    def test_read_cr_line_endings(self, tmp_path):
+        """Testa arquivo com finais de linha \\r (Mac clássico)."""
+        fasta_file = tmp_path / "cr.fasta"
+        fasta_file.write_bytes(b'>h\rACGT\racgt\r')
+
+        reader = FastaReader()
+        result = reader.read(str(fasta_file))
+
+        assert result['header'] == 'h'
+        assert result['sequence'] == 'ACGTACGT'
+
+    def test_read_crlf_line_endings(self, tmp_path):
+        """Testa arquivo com finais de linha \\r\\n (Windows)."""
+        fasta_file = tmp_path / "crlf.fasta"
+        fasta_file.write_bytes(b'>h\r\nACGT\r\nacgt\r\n')
+
+        reader = FastaReader()
+        result = reader.read(str(fasta_file))
+
+        assert result['header'] == 'h'
+        assert result['sequence'] == 'ACGTACGT'
+
     def test_read_lowercase_converted(self, tmp_path):
         """Testa que minúsculas são convertidas."""
         fasta_file = tmp_path / "lower.fasta"
@@ -73,3 +105,36 @@ atgcgatc"""
 
         assert result is None
 
+    def test_read_header_only(self, tmp_path):
+        """Testa leitura apenas do cabeçalho."""
+        fasta_file = tmp_path / "header.fasta"
+        fasta_content = """>header_only descrição
+ATGCGATC
+GATCGATC"""
+        fasta_file.write_text(fasta_content, encoding='utf-8')
+
+        reader = FastaReader()
+        header = reader.read_header(str(fasta_file))
+
+        assert header == 'header_only descrição'
+
+    def test_read_header_returns_first_header(self, tmp_path):
+        """Testa que read_header para no primeiro cabeçalho."""
+        fasta_file = tmp_path / "multi_header.fasta"
+        fasta_content = """>a
+AC
+>b
+GT"""
+        fasta_file.write_text(fasta_content)
+
+        reader = FastaReader()
+        header = reader.read_header(str(fasta_file))
+
+        assert header == 'a'
+
+    def test_read_header_nonexistent_file(self):
+        """Testa leitura de cabeçalho de arquivo inexistente."""
+        reader = FastaReader()
+        header = reader.read_header("nonexistent.fasta")
+
+        assert header is None
@@ -0,0 +1,67 @@
+"""
+Testes unitários para HTMLGenerator.
+"""
+
+import pytest
+from src.html_generator import HTMLGenerator
+
+
+class TestHTMLGenerator:
+    """Testes para a classe HTMLGenerator."""
+
+    def _generate(self, header="seq_teste", dna="ATGC", rna="AUGC", protein="M"):
+        """Gera relatório com estatísticas fixas."""
+        stats = {
+            'length': 1234,
+            'gc_percent': 50.0,
+            'counts': {'T': 1, 'A': 1, 'G': 1, 'C': 1}
+        }
+        generator = HTMLGenerator()
+        return generator.generate(
+            header=header,
+            dna_sequence=dna,
+            rna_sequence=rna,
+            protein_sequence=protein,
+            stats=stats
+        )
+
+    def test_generate_structure(self):
+        """Testa a estrutura básica do HTML."""
+        html = self._generate()
+
+        assert html.startswith('<!DOCTYPE html>\n<html lang="pt-BR">\n<head>')
+        assert html.endswith('    </div>\n</body>\n</html>')
+        assert '    <title>Relatório estatístico</title>' in html
+        assert '        .container {' in html
+        assert html.count('<div class="sequence-box">') == 3
+
+    def test_generate_stats(self):
+        """Testa que as estatísticas aparecem formatadas."""
+        html = self._generate()
+
+        assert '<div class="stat-value">1,234 bp</div>' in html
+        assert '<div class="stat-value">50.00%</div>' in html
+        # Contagens em ordem alfabética
+        assert html.index('stat-label">A<') < html.index('stat-label">C<')
+        assert html.index('stat-label">G<') < html.index('stat-label">T<')
+
+    def test_generate_sequences(self):
+        """Testa que as sequências aparecem nas caixas corretas."""
+        html = self._generate(dna="ATGCCC", rna="AUGCCC", protein="MP")
+
+        assert '<div class="sequence-box">\nATGCCC\n        </div>' in html
+        assert '<div class="sequence-box">\nAUGCCC\n        </div>' in html
+        assert '<div class="sequence-box">\nMP\n        </div>' in html
+
+    def test_generate_wraps_sequence(self):
+        """Testa que sequências longas são quebradas em linhas de 60."""
+        dna = "A" * 60 + "C" * 10
+        html = self._generate(dna=dna)
+
+        assert "A" * 60 + "\n" + "C" * 10 + "\n" in html
+
+    def test_generate_escapes_header(self):
+        """Testa que o cabeçalho é escapado."""
+        html = self._generate(header="a<b>&c")
+
+        assert '<strong>Sequência:</strong> a&lt;b&gt;&amp;c' in html